@@ -7,6 +7,7 @@ from importlib.resources import files
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, ParamSpec, Protocol
 import asyncio
+import atexit
 import json
 import logging
 import os
@@ -145,6 +146,22 @@ class ImplementationSubcommand(Protocol):
 SILENT = _report.Reporter(write=lambda **_: None)  # type: ignore[reportUnknownArgumentType])
 
 
+@cache
+def _stdout_reporter() -> _report.Reporter:
+    """
+    The reporter for runs, which writes to standard output.
+
+    Writes happen on a background thread if ``BOWTIE_BACKGROUND_WRITES`` is
+    set to anything other than an empty or false-looking value.
+    """
+    background = os.environ.get("BOWTIE_BACKGROUND_WRITES", "").strip()
+    if background.lower() in {"", "0", "false", "no", "off"}:
+        return _report.Reporter()
+    reporter = _report.Reporter(write=_report.writer(background=True))
+    atexit.register(reporter.flush)
+    return reporter
+
+
 def implementation_subcommand(reporter: _report.Reporter = SILENT):
     """
     Define a Bowtie subcommand which starts up some implementations.
@@ -829,7 +846,7 @@ async def smoke(
                         serializable.append(
                             dict(
                                 case=case.without_expected_results(),
-                                result=asdict(result.result),
+                                result=result.result.serializable(),
                             ),
                         )
 
@@ -912,9 +929,11 @@ async def _run(
     fail_fast: bool,
     set_schema: bool,
     run_metadata: dict[str, Any] = {},
-    reporter: _report.Reporter = _report.Reporter(),
+    reporter: _report.Reporter | None = None,
     **kwargs: Any,
 ) -> int:
+    if reporter is None:
+        reporter = _stdout_reporter()
     exit_code = 0
     acknowledged: list[ImplementationInfo] = []
     runners: list[DialectRunner] = []
@@ -1080,4 +1099,5 @@ def _redirect_structlog(
         ],
         logger_factory=structlog.WriteLoggerFactory(file),
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
+        cache_logger_on_first_use=True,
     )
@@ -12,7 +12,7 @@ try:
 except ImportError:
     from typing_extensions import dataclass_transform
 
-from attrs import asdict, field, frozen
+from attrs import field, fields, frozen
 
 from bowtie import HOMEPAGE, exceptions
 
@@ -25,7 +25,7 @@ if TYPE_CHECKING:
         Sequence,
     )
 
-    from structlog.stdlib import BoundLogger
+    from structlog.typing import FilteringBoundLogger
 
     from bowtie._core import DialectRunner, TestCase
 
@@ -121,11 +121,17 @@ def command(
         request_schema = {"$ref": str(uri)}
         response_schema = {"$ref": f"{uri}#response"}  # FIXME: crate-py/url#6
 
+        frozen_cls = frozen(cls)
+        # Commands only contain JSON-compatible values, so rather than
+        # reflecting over (and deep copying) them via asdict for every
+        # request, just read off their fields.
+        names = [each.name for each in fields(frozen_cls)]
+
         def to_request(
             self: Command[R_co],
             validate: Callable[..., None],
         ) -> Message:
-            request = dict(cmd=name, **asdict(self))
+            request = dict(cmd=name, **{k: getattr(self, k) for k in names})
             validate(instance=request, schema=request_schema)
             return request
 
@@ -137,9 +143,9 @@ def command(
             validate(instance=response, schema=response_schema)
             return Response(**response)
 
-        cls.to_request = to_request
-        cls.from_response = from_response
-        return frozen(cls)
+        frozen_cls.to_request = to_request
+        frozen_cls.from_response = from_response
+        return frozen_cls
 
     return _command
 
@@ -181,6 +187,8 @@ class AnyTestResult(Protocol):
     @property
     def errored(self) -> bool: ...
 
+    def serializable(self) -> Message: ...
+
 
 @frozen
 class TestResult:
@@ -201,6 +209,9 @@ class TestResult:
             return ErroredTest(**data)
         return cls(valid=data["valid"])
 
+    def serializable(self) -> Message:
+        return dict(valid=self.valid)
+
 
 TestResult.VALID = TestResult(valid=True)  # type: ignore[reportGeneralTypeIssues]
 TestResult.INVALID = TestResult(valid=False)  # type: ignore[reportGeneralTypeIssues]
@@ -224,6 +235,13 @@ class SkippedTest:
             return self.issue_url
         return "skipped"
 
+    def serializable(self) -> Message:
+        return dict(
+            message=self.message,
+            issue_url=self.issue_url,
+            skipped=True,
+        )
+
     @classmethod
     def in_skipped_case(cls):
         """
@@ -248,6 +266,9 @@ class ErroredTest:
             return message
         return "Encountered an error."
 
+    def serializable(self) -> Message:
+        return dict(context=self.context, errored=True, skipped=self.skipped)
+
     @classmethod
     def in_errored_case(cls):
         """
@@ -264,7 +285,14 @@ class AnyCaseResult(Protocol):
 
     def result_for(self, i: int) -> AnyTestResult: ...
 
-    def log(self, log: BoundLogger) -> None: ...
+    def log(
+        self,
+        log: FilteringBoundLogger,
+        implementation: ImplementationId,
+        context: Mapping[str, Any],
+    ) -> None: ...
+
+    def serializable(self) -> Message: ...
 
     def unsuccessful(
         self,
@@ -342,14 +370,25 @@ class SeqResult:
     def unsuccessful(self) -> Unsuccessful:
         return self.result.unsuccessful(expected=self.expected)
 
-    def log_and_be_serialized(self, log: BoundLogger) -> Mapping[str, Any]:
-        self.result.log(log)
+    def log_and_be_serialized(
+        self,
+        log: FilteringBoundLogger,
+        context: Mapping[str, Any] = {},
+    ) -> Mapping[str, Any]:
+        self.result.log(
+            log,
+            implementation=self.implementation,
+            context=context,
+        )
         return self.serializable()
 
-    def serializable(self):
-        serializable = asdict(self)
-        serializable.update(serializable.pop("result"))
-        return serializable
+    def serializable(self) -> Message:
+        return dict(
+            seq=self.seq,
+            implementation=self.implementation,
+            expected=list(self.expected),
+            **self.result.serializable(),
+        )
 
 
 @frozen
@@ -378,10 +417,22 @@ class CaseResult:
                 failed += 1
         return Unsuccessful(skipped=skipped, failed=failed, errored=errored)
 
-    def log(self, log: BoundLogger):
+    def log(
+        self,
+        log: FilteringBoundLogger,
+        implementation: ImplementationId,
+        context: Mapping[str, Any],
+    ):
         for result in self.results:
             if result.errored:
-                log.error("", **result.context)  # type: ignore[reportGeneralTypeIssues, reportUnknownMemberType]
+                error = result.context  # type: ignore[reportGeneralTypeIssues, reportUnknownMemberType]
+                log.error(
+                    "",
+                    **{**context, "logger_name": implementation, **error},
+                )
+
+    def serializable(self) -> Message:
+        return dict(results=[each.serializable() for each in self.results])
 
 
 @frozen
@@ -407,8 +458,24 @@ class CaseErrored:
     def unsuccessful(self, expected: Sequence[bool | None]) -> Unsuccessful:
         return Unsuccessful(errored=len(expected))
 
-    def log(self, log: BoundLogger):
-        log.error(self.message, **self.context)
+    def log(
+        self,
+        log: FilteringBoundLogger,
+        implementation: ImplementationId,
+        context: Mapping[str, Any],
+    ):
+        log.error(
+            self.message,
+            **{**context, "logger_name": implementation, **self.context},
+        )
+
+    def serializable(self) -> Message:
+        return dict(
+            context=self.context,
+            message=self.message,
+            caught=self.caught,
+            errored=True,
+        )
 
 
 @frozen
@@ -429,8 +496,23 @@ class CaseSkipped:
     def unsuccessful(self, expected: Sequence[bool | None]) -> Unsuccessful:
         return Unsuccessful(skipped=len(expected))
 
-    def log(self, log: BoundLogger):
-        log.info(self.message or "skipped case")
+    def log(
+        self,
+        log: FilteringBoundLogger,
+        implementation: ImplementationId,
+        context: Mapping[str, Any],
+    ):
+        log.info(
+            self.message or "skipped case",
+            **{**context, "logger_name": implementation},
+        )
+
+    def serializable(self) -> Message:
+        return dict(
+            message=self.message,
+            issue_url=self.issue_url,
+            skipped=True,
+        )
 
 
 @frozen
@@ -444,8 +526,16 @@ class Empty:
     def result_for(self, i: int) -> ErroredTest:
         return ErroredTest.in_errored_case()
 
-    def log(self, log: BoundLogger):
-        log.error("No response")
+    def log(
+        self,
+        log: FilteringBoundLogger,
+        implementation: ImplementationId,
+        context: Mapping[str, Any],
+    ):
+        log.error("No response", **{**context, "logger_name": implementation})
+
+    def serializable(self) -> Message:
+        return {}
 
     def unsuccessful(self, expected: Sequence[bool | None]) -> Unsuccessful:
         return Unsuccessful(errored=len(expected))
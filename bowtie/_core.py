@@ -92,6 +92,24 @@ class Dialect:
     def by_uri(cls) -> HashTrieMap[URL, Dialect]:
         return HashTrieMap((each.uri, each) for each in cls.known())
 
+    @classmethod
+    @cache
+    def _by_uri_str(cls) -> HashTrieMap[str, Dialect]:
+        return HashTrieMap((str(each.uri), each) for each in cls.known())
+
+    @classmethod
+    def for_uri(cls, uri: str) -> Dialect:
+        """
+        The known dialect with the given URI.
+
+        URIs which are already in their normalized form (as they are in
+        Bowtie's own output) are looked up without needing to parse them.
+        """
+        dialect = cls._by_uri_str().get(uri)
+        if dialect is None:
+            return cls.by_uri()[URL.parse(uri)]
+        return dialect
+
     @classmethod
     @cache
     def known(cls) -> Iterable[Dialect]:
@@ -231,12 +249,11 @@ class ImplementationInfo:
         links: Iterable[dict[str, Any]] = (),
         **kwargs: Any,
     ):
-        BY_URI = Dialect.by_uri()
         return cls(
             homepage=URL.parse(homepage),
             issues=URL.parse(issues),
             source=URL.parse(source),
-            dialects=frozenset(BY_URI[URL.parse(each)] for each in dialects),
+            dialects=frozenset(Dialect.for_uri(each) for each in dialects),
             links=[Link.from_dict(**each) for each in links],
             **kwargs,
         )
@@ -396,7 +413,7 @@ class DialectRunner:
                         message="mismatched seq",
                         expected=run.seq,
                         got=seq,
-                        response=result,
+                        response=result.serializable(),
                     )
         except GotStderr as error:
             result = CaseErrored.uncaught(stderr=error.stderr.decode("utf-8"))
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from queue import SimpleQueue
+from threading import Event, Thread
 from typing import TYPE_CHECKING
+import atexit
+import codecs
 import importlib.metadata
 import json
+import os
+import re
 import sys
 
-from attrs import asdict, field, frozen
-from attrs.filters import exclude
+from attrs import Factory, asdict, field, frozen, mutable
 from rpds import HashTrieMap
-from url import URL
-import structlog.stdlib
+import structlog
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson: ModuleType | None = None
 
 from bowtie._commands import (
-    Seq,
     SeqCase,
     SeqResult,
     StartedDialect,
@@ -22,11 +30,20 @@ from bowtie._commands import (
 from bowtie._core import Dialect, TestCase
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping, Sequence
+    from collections.abc import Callable, Iterable, Mapping, Sequence, Set
     from pathlib import Path
-    from typing import Any, Self, TextIO
+    from types import ModuleType
+    from typing import Any, BinaryIO, Self, TextIO
+
+    from structlog.typing import FilteringBoundLogger
 
-    from bowtie._commands import AnyTestResult, Command, ImplementationId
+    from bowtie._commands import (
+        AnyTestResult,
+        Command,
+        ImplementationId,
+        Message,
+        Seq,
+    )
     from bowtie._core import Implementation, ImplementationInfo, Test
 
 
@@ -57,16 +74,189 @@ class MissingFooter(InvalidReport):
     """
 
 
-def writer(file: TextIO = sys.stdout) -> Callable[..., Any]:
-    return lambda **result: file.write(f"{json.dumps(result)}\n")  # type: ignore[reportUnknownArgumentType]
+#: How many bytes of output to accumulate before writing them out.
+FLUSH_THRESHOLD = 64 * 1024
+
+#: Enough digits to possibly be an integer which orjson would turn into a float
+_MAYBE_BIG_INTEGER = re.compile(r"\d{19}")
+
+
+def _dumps(result: Mapping[str, Any]) -> bytes:
+    """
+    Serialize a JSON line, preferring orjson when it's installed.
+
+    Note that orjson writes non-finite floats (NaN and infinities) as ``null``
+    rather than json's non-standard ``NaN`` / ``Infinity``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # e.g. integers larger than orjson supports
+            pass
+    return f"{json.dumps(result)}\n".encode()
+
+
+def _loads(line: str) -> Any:
+    """
+    Deserialize a JSON line, preferring orjson when it's installed.
+    """
+    if orjson is None or _MAYBE_BIG_INTEGER.search(line):
+        return json.loads(line)
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:  # e.g. lone surrogates, which json allows
+        return json.loads(line)
+
+
+@mutable
+class _BufferedWriter:
+    """
+    Write JSON lines to a binary file in chunks rather than one at a time.
+    """
+
+    _file: BinaryIO = field(alias="file")
+    _threshold: int = field(default=FLUSH_THRESHOLD, alias="threshold")
+    _pending: bytearray = field(factory=bytearray, init=False)
+
+    def __call__(self, **result: Any):
+        self._pending += _dumps(result)
+        if len(self._pending) >= self._threshold:
+            self.flush()
+
+    def flush(self):
+        if not self._pending or self._file.closed:
+            return
+        self._file.write(self._pending)
+        self._file.flush()
+        self._pending.clear()
+
+
+@mutable
+class _BackgroundWriter:
+    """
+    Serialize JSON lines on the caller's thread, but write them on another.
+
+    Useful when the output is a slow consumer (e.g. a pipe to another
+    process), which otherwise would hold up running test cases.
+    """
+
+    _file: BinaryIO = field(alias="file")
+    _threshold: int = field(default=FLUSH_THRESHOLD, alias="threshold")
+    _queue: SimpleQueue[bytes | Event | None] = field(
+        factory=SimpleQueue,
+        init=False,
+    )
+    _thread: Thread = field(init=False)
+    _error: Exception | None = field(default=None, init=False)
+    _closed: bool = field(default=False, init=False)
+
+    def __attrs_post_init__(self):
+        self._thread = Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def __call__(self, **result: Any):
+        self._raise_if_unusable()
+        self._queue.put(_dumps(result))
+
+    def flush(self):
+        """
+        Block until everything written so far has reached the file.
+        """
+        self._raise_if_unusable()
+        flushed = Event()
+        self._queue.put(flushed)
+        flushed.wait()
+        self._raise_if_unusable()
+
+    def close(self):
+        """
+        Write out everything written so far, and then stop writing for good.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _raise_if_unusable(self):
+        if self._closed:
+            raise ValueError("I/O operation on closed writer.")
+        if self._error is not None:
+            raise self._error
+
+    def _drain(self):
+        queue, pending = self._queue, bytearray()
+        while True:
+            item = queue.get()
+            if isinstance(item, bytes):
+                pending += item
+                if len(pending) < self._threshold and not queue.empty():
+                    continue  # more is waiting, so coalesce it into one write
+
+            try:
+                if self._error is None:
+                    if pending:
+                        self._file.write(pending)
+                    if not isinstance(item, bytes):
+                        self._file.flush()
+            except Exception as error:  # noqa: BLE001 (e.g. BrokenPipeError)
+                # Keep draining (and discarding) so that no flush waits
+                # forever, and re-raise this on the writing thread instead.
+                self._error = error
+            pending.clear()
+
+            if item is None:
+                return
+            if isinstance(item, Event):
+                item.set()
+
+
+def writer(
+    file: TextIO = sys.stdout,
+    background: bool = False,
+) -> Callable[..., Any]:
+    """
+    Write JSON lines of output to the given file.
+
+    If requested, writes are performed on a separate thread, which can be
+    closed once nothing more will be written.
+    """
+    # Serialized lines are UTF-8 with bare newlines, so they may only skip the
+    # text layer if it wouldn't have changed them.
+    buffer = getattr(file, "buffer", None)
+    encoding = getattr(file, "encoding", None) or "ascii"
+    if (
+        buffer is None
+        or codecs.lookup(encoding).name != "utf-8"
+        or os.linesep != "\n"
+    ):
+        return lambda **result: file.write(f"{json.dumps(result)}\n")  # type: ignore[reportUnknownArgumentType]
+
+    file.flush()  # so nothing already written lands after what we write
+
+    if background:
+        return _BackgroundWriter(file=buffer)
+
+    if getattr(file, "line_buffering", False):
+        # Someone is likely watching interactively, so hold nothing back.
+        write = _BufferedWriter(file=buffer, threshold=0)
+    else:
+        write = _BufferedWriter(file=buffer)
+    return write
+
+
+#: The writer for standard output, flushed at exit in case nobody else did.
+_STDOUT = writer()
+if isinstance(_STDOUT, _BufferedWriter):
+    atexit.register(_STDOUT.flush)
 
 
 @frozen
 class Reporter:
-    _write: Callable[..., Any] = field(default=writer(), alias="write")
-    _log: structlog.stdlib.BoundLogger = field(
-        factory=structlog.stdlib.get_logger,
-    )
+    _write: Callable[..., Any] = field(default=_STDOUT, alias="write")
+    _log: FilteringBoundLogger = field(factory=structlog.get_logger)
 
     def unsupported_dialect(
         self,
@@ -108,6 +298,15 @@ class Reporter:
         else:
             self._log.info("Finished", count=count)
         self._write(did_fail_fast=did_fail_fast)
+        self.flush()
+
+    def flush(self):
+        """
+        Write out any output which is still being buffered.
+        """
+        flush = getattr(self._write, "flush", None)
+        if flush is not None:  # plain callables don't buffer anything
+            flush()
 
     def no_such_image(self, name: str):
         self._log.error("Not a known Bowtie implementation.", logger_name=name)
@@ -146,22 +345,27 @@ class Reporter:
 
     def case_started(self, seq_case: SeqCase):
         self._write(**seq_case.serializable())
-        log = self._log.bind(
+        # Most cases never log anything, so rather than binding a new logger
+        # for each one, pass this along to be included only when they do.
+        context = dict(
             seq=seq_case.seq,
             case=seq_case.case.description,
             schema=seq_case.case.schema,
         )
-        return CaseReporter(write=self._write, log=log)
+        return CaseReporter(write=self._write, log=self._log, context=context)
 
 
 @frozen
 class CaseReporter:
     _write: Callable[..., Any] = field(alias="write")
-    _log: structlog.stdlib.BoundLogger = field(alias="log")
+    _log: FilteringBoundLogger = field(alias="log")
+    _context: Mapping[str, Any] = field(factory=dict, alias="context")
 
     def got_result(self, result: SeqResult):
-        log = self._log.bind(logger_name=result.implementation)
-        serialized = result.log_and_be_serialized(log=log)
+        serialized = result.log_and_be_serialized(
+            log=self._log,
+            context=self._context,
+        )
         self._write(**serialized)
 
 
@@ -197,7 +401,7 @@ class RunMetadata:
         if started is not None:
             kwargs["started"] = datetime.fromisoformat(started)
         return cls(
-            dialect=Dialect.by_uri()[URL.parse(dialect)],
+            dialect=Dialect.for_uri(dialect),
             implementations=[
                 ImplementationInfo.from_dict(image=image, **data)
                 for image, data in implementations.items()
@@ -205,21 +409,17 @@ class RunMetadata:
             **kwargs,
         )
 
-    def serializable(self):
-        as_dict = asdict(
-            self,
-            filter=exclude("dialect"),
-            recurse=False,
-        )
-        as_dict.update(
-            dialect=str(self.dialect.uri),
-            started=as_dict.pop("started").isoformat(),
+    def serializable(self) -> Message:
+        return dict(
             # FIXME: This transformation is to support the UI parsing
             implementations={
                 i.id: i.serializable() for i in self.implementations
             },
+            bowtie_version=self.bowtie_version,
+            metadata=self.metadata,
+            dialect=str(self.dialect.uri),
+            started=self.started.isoformat(),
         )
-        return as_dict
 
 
 @frozen(eq=False)
@@ -238,7 +438,7 @@ class Report:
     _cases: HashTrieMap[Seq, TestCase] = field(alias="cases", repr=False)
     _results: HashTrieMap[
         ImplementationId,
-        HashTrieMap[Seq, SeqResult],
+        Mapping[Seq, SeqResult],
     ] = field(
         repr=False,
         alias="results",
@@ -246,6 +446,23 @@ class Report:
     metadata: RunMetadata
     did_fail_fast: bool
 
+    _total_tests: int = field(
+        default=Factory(
+            lambda self: sum(len(case.tests) for case in self._cases.values()),
+            takes_self=True,
+        ),
+        init=False,
+        repr=False,
+    )
+    _sorted_cases: Sequence[tuple[Seq, TestCase]] = field(
+        default=Factory(
+            lambda self: tuple(sorted(self._cases.items())),
+            takes_self=True,
+        ),
+        init=False,
+        repr=False,
+    )
+
     def __eq__(self, other: object):
         if type(other) is not Report:
             return NotImplemented
@@ -258,8 +475,9 @@ class Report:
 
         this, that = asdict(self, recurse=False), asdict(other, recurse=False)
 
-        cases = [v for _, v in sorted(this.pop("_cases").items())]
-        if cases != [v for _, v in sorted(that.pop("_cases").items())]:
+        del this["_cases"], that["_cases"]
+        cases = [v for _, v in this.pop("_sorted_cases")]
+        if cases != [v for _, v in that.pop("_sorted_cases")]:
             return False
 
         other_results = that.pop("_results")
@@ -277,40 +495,43 @@ class Report:
             raise EmptyReport()
         metadata = RunMetadata.from_dict(**header)
 
-        cases: HashTrieMap[Seq, TestCase] = HashTrieMap()
-        empty: HashTrieMap[Seq, SeqResult] = HashTrieMap()
-        ids = (each.id for each in metadata.implementations)
-        results = HashTrieMap.fromkeys(ids, empty)
+        # Assemble into plain dicts rather than paying for an immutable insert
+        # for every line. Each implementation's results are never modified
+        # once read, so only the outer mapping is converted at the end.
+        cases: dict[Seq, TestCase] = {}
+        results: dict[ImplementationId, dict[Seq, SeqResult]] = {
+            each.id: {} for each in metadata.implementations
+        }
 
+        dialect = metadata.dialect
         for data in iterator:
-            match data:
-                case {"seq": Seq(seq), "case": case}:
-                    if seq in cases:
-                        raise DuplicateCase(seq)
-                    case = TestCase.from_dict(dialect=metadata.dialect, **case)
-                    cases = cases.insert(seq, case)
-                    continue
-                case {"did_fail_fast": did_fail_fast}:
-                    return cls(
-                        results=results,
-                        cases=cases,
-                        metadata=metadata,
-                        did_fail_fast=did_fail_fast,
-                    )
-                case _:
-                    result = SeqResult.from_dict(**data)
-
-            current = results.get(result.implementation, HashTrieMap())
-            results = results.insert(  # TODO: Complain if present
-                result.implementation,
-                current.insert(result.seq, result),
-            )
+            # Results are by far the most common line, but are also the only
+            # kind without a distinguishing key, so they come last.
+            if "case" in data:
+                seq = data["seq"]
+                if seq in cases:
+                    raise DuplicateCase(seq)
+                case = TestCase.from_dict(dialect=dialect, **data["case"])
+                cases[seq] = case
+            elif "did_fail_fast" in data:
+                return cls(
+                    results=HashTrieMap(results),
+                    cases=HashTrieMap(cases),
+                    metadata=metadata,
+                    did_fail_fast=data["did_fail_fast"],
+                )
+            else:
+                result = SeqResult.from_dict(**data)
+                current = results.get(result.implementation)
+                if current is None:  # i.e. not in the metadata
+                    current = results[result.implementation] = {}
+                current[result.seq] = result  # TODO: Complain if present
 
         raise MissingFooter()
 
     @classmethod
     def from_serialized(cls, serialized: Iterable[str]) -> Self:
-        return cls.from_input(json.loads(line) for line in serialized)
+        return cls.from_input(_loads(line) for line in serialized)
 
     @classmethod
     def empty(
@@ -338,14 +559,19 @@ class Report:
 
     @property
     def total_tests(self):
-        return sum(len(case.tests) for case in self._cases.values())
+        return self._total_tests
 
     def unsuccessful(self, implementation: ImplementationId) -> Unsuccessful:
         """
         A count of the unsuccessful tests for the given implementation.
         """
-        results = self._results[implementation].values()
-        return sum((each.unsuccessful() for each in results), Unsuccessful())
+        failed = errored = skipped = 0
+        for each in self._results[implementation].values():
+            unsuccessful = each.unsuccessful()
+            failed += unsuccessful.failed
+            errored += unsuccessful.errored
+            skipped += unsuccessful.skipped
+        return Unsuccessful(failed=failed, errored=errored, skipped=skipped)
 
     def worst_to_best(self):
         """
@@ -368,48 +594,62 @@ class Report:
             Iterable[tuple[Test, Mapping[str, AnyTestResult]]],
         ]
     ]:
-        for seq, case in sorted(self._cases.items()):
+        ids = [each.id for each in self.implementations]
+        for seq, case in self._sorted_cases:
+            case_results = [(id, self._results[id][seq]) for id in ids]
             test_results: list[tuple[Test, Mapping[str, AnyTestResult]]] = []
             for i, test in enumerate(case.tests):
                 test_result = {
-                    each.id: self._results[each.id][seq].result_for(i)
-                    for each in self.implementations
+                    id: result.result_for(i) for id, result in case_results
                 }
                 test_results.append((test, test_result))
             yield case, test_results
 
     def generate_badges(self, target_dir: Path):
-        label = self.metadata.dialect.pretty_name
+        dialect = self.metadata.dialect
+        label = dialect.pretty_name
+        badge_name = f"{label.replace(' ', '_')}.json"
         total = self.total_tests
+
+        # Compliance badges otherwise differ only in (known-safe) numbers.
+        label_json = json.dumps(label)
+
+        # Many implementations support the exact same set of dialects.
+        supported_badges: dict[Set[Dialect], bytes] = {}
+
         for implementation in self.implementations:
-            if self.metadata.dialect not in implementation.dialects:
+            if dialect not in implementation.dialects:
                 continue
-            shortnames = (
-                each.pretty_name.removeprefix("Draft ")
-                for each in implementation.dialects
-            )
-            supported = ", ".join(sorted(shortnames))  # FIXME: proper sort
+            supported_badge = supported_badges.get(implementation.dialects)
+            if supported_badge is None:
+                shortnames = (
+                    each.pretty_name.removeprefix("Draft ")
+                    for each in implementation.dialects
+                )
+                supported = ", ".join(sorted(shortnames))  # FIXME: proper sort
+                supported_badge = json.dumps(
+                    {
+                        "schemaVersion": 1,
+                        "label": "JSON Schema Versions",
+                        "message": supported,
+                        "color": "lightgreen",
+                    },
+                ).encode()
+                supported_badges[implementation.dialects] = supported_badge
             unsuccessful = self.unsuccessful(implementation.id)
             passed = total - unsuccessful.total
             pct = (passed / total) * 100
             r, g, b = 100 - int(pct), int(pct), 0
-            badge_per_draft = {
-                "schemaVersion": 1,
-                "label": label,
-                "message": "%d%% Passing" % int(pct),
-                "color": f"{r:02x}{g:02x}{b:02x}",
-            }
+            badge_per_draft = (
+                f'{{"schemaVersion": 1, "label": {label_json}, '
+                f'"message": "{int(pct)}% Passing", '
+                f'"color": "{r:02x}{g:02x}{b:02x}"}}'
+            )
             impl_dir = f"{implementation.language}-{implementation.name}"
             supp_dir = target_dir / impl_dir
             comp_dir = supp_dir / "compliance"
             comp_dir.mkdir(parents=True, exist_ok=True)
-            badge_path_per_draft = comp_dir / f"{label.replace(' ', '_')}.json"
-            badge_path_per_draft.write_text(json.dumps(badge_per_draft))
-            badge_supp_draft = {
-                "schemaVersion": 1,
-                "label": "JSON Schema Versions",
-                "message": supported,
-                "color": "lightgreen",
-            }
+            badge_path_per_draft = comp_dir / badge_name
+            badge_path_per_draft.write_bytes(badge_per_draft.encode())
             badge_supported = supp_dir / "supported_versions.json"
-            badge_supported.write_text(json.dumps(badge_supp_draft))
+            badge_supported.write_bytes(supported_badge)
@@ -155,7 +155,7 @@ def typing(session):
     """
     Check Bowtie's codebase using pyright.
     """
-    session.install("pyright", f"{ROOT}[strategies]")
+    session.install("pyright", f"{ROOT}[strategies,speedups]")
     session.run("pyright", *session.posargs, BOWTIE)
 
 
@@ -3,3 +3,13 @@ from bowtie._core import Dialect
 
 def test_latest():
     assert max(Dialect.known()).pretty_name == "Draft 2020-12"
+
+
+def test_for_uri():
+    for dialect in Dialect.known():
+        assert Dialect.for_uri(str(dialect.uri)) == dialect
+
+
+def test_for_uri_unnormalized():
+    dialect = Dialect.for_uri("HTTPS://json-schema.org/draft/2020-12/schema")
+    assert dialect == Dialect.by_alias()["2020"]
@@ -1,14 +1,38 @@
+from io import BytesIO, StringIO, TextIOWrapper
+import json
+
+from attrs import asdict
 from hypothesis import given
 from hypothesis.strategies import sets
 import pytest
 
 from bowtie import HOMEPAGE, REPO
-from bowtie._commands import CaseResult, SeqCase, SeqResult
+from bowtie._commands import (
+    CaseResult,
+    ErroredTest,
+    SeqCase,
+    SeqResult,
+    TestResult,
+)
 from bowtie._core import Dialect, ImplementationInfo, Test, TestCase
-from bowtie._report import Report, RunMetadata
-from bowtie.hypothesis import dialects, implementations, known_dialects
+from bowtie._report import (
+    DuplicateCase,
+    MissingFooter,
+    Report,
+    Reporter,
+    RunMetadata,
+    writer,
+)
+from bowtie.hypothesis import (
+    dialects,
+    implementations,
+    known_dialects,
+    seq_results,
+)
 
-Test.__test__ = TestCase.__test__ = False  # frigging py.test
+Test.__test__ = TestCase.__test__ = TestResult.__test__ = (
+    False  # frigging py.test
+)
 
 
 DIALECT = Dialect.by_alias()["2020"]
@@ -49,7 +73,7 @@ def test_eq():
             seq=1,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": True}]),
+            result=CaseResult(results=[TestResult.VALID]),
         ).serializable(),
         SeqCase(
             seq=2,
@@ -79,7 +103,7 @@ def test_eq_different_seqs():
             seq=1,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": True}]),
+            result=CaseResult(results=[TestResult.VALID]),
         ).serializable(),
         SeqCase(
             seq=2,
@@ -105,7 +129,7 @@ def test_eq_different_seqs():
             seq=1,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": True}]),
+            result=CaseResult(results=[TestResult.VALID]),
         ).serializable(),
         SeqCase(
             seq=200,
@@ -135,7 +159,7 @@ def test_eq_different_order():
             seq=1,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": True}]),
+            result=CaseResult(results=[TestResult.VALID]),
         ).serializable(),
         SeqCase(
             seq=2,
@@ -169,7 +193,7 @@ def test_eq_different_order():
             seq=1,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": True}]),
+            result=CaseResult(results=[TestResult.VALID]),
         ).serializable(),
         NO_FAIL_FAST,
     ]
@@ -192,7 +216,7 @@ def test_eq_different_seqs_different_order():
             seq=1,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": True}]),
+            result=CaseResult(results=[TestResult.VALID]),
         ).serializable(),
         SeqCase(
             seq=2,
@@ -226,7 +250,7 @@ def test_eq_different_seqs_different_order():
             seq=100,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": True}]),
+            result=CaseResult(results=[TestResult.VALID]),
         ).serializable(),
         NO_FAIL_FAST,
     ]
@@ -248,7 +272,7 @@ def test_ne_different_results():
             seq=1,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": True}]),
+            result=CaseResult(results=[TestResult.VALID]),
         ).serializable(),
         SeqCase(
             seq=2,
@@ -274,7 +298,7 @@ def test_ne_different_results():
             seq=1,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": False}]),
+            result=CaseResult(results=[TestResult.INVALID]),
         ).serializable(),
         SeqCase(
             seq=2,
@@ -313,7 +337,7 @@ def test_ne_different_implementations(dialect):
             seq=1,
             implementation="foo",
             expected=[None],
-            result=CaseResult(results=[{"valid": True}]),
+            result=CaseResult(results=[TestResult.VALID]),
         ).serializable(),
         SeqCase(
             seq=2,
@@ -358,3 +382,181 @@ def test_empty_is_empty(dialect):
 def test_empty_with_implementations_is_empty(dialect, implementations):
     report = Report.empty(dialect=dialect, implementations=implementations)
     assert report.is_empty
+
+
+@given(seq_results())
+def test_seq_result_roundtrips_through_serializable(result):
+    assert SeqResult.from_dict(**result.serializable()) == result
+
+
+@pytest.mark.parametrize("skipped", [True, False])
+def test_errored_test_serializable(skipped):
+    errored = ErroredTest(context={"message": "boom"}, skipped=skipped)
+    assert errored.serializable() == asdict(errored)
+
+
+def test_from_serialized_preserves_big_integers():
+    big = 12345678910111213141516171819202122232425262728293031
+    data = [
+        FOO_RUN.serializable(),
+        SeqCase(
+            seq=1,
+            case=TestCase(
+                description="bignum",
+                schema={"maximum": big},
+                tests=[Test(description="1", instance=big)],
+            ),
+        ).serializable(),
+        SeqResult(
+            seq=1,
+            implementation="foo",
+            expected=[None],
+            result=CaseResult(results=[TestResult.VALID]),
+        ).serializable(),
+        NO_FAIL_FAST,
+    ]
+    serialized = [json.dumps(each) for each in data]
+    assert Report.from_serialized(serialized) == Report.from_input(data)
+
+
+def test_written_lone_surrogates_can_be_read_back():
+    file = TextIOWrapper(BytesIO(), encoding="utf-8")
+    reporter = Reporter(write=writer(file))
+    reporter.ready(FOO_RUN)
+    seq_case = SeqCase(
+        seq=1,
+        case=TestCase(
+            description="surrogate",
+            schema={},
+            tests=[Test(description="1", instance="\ud800")],
+        ),
+    )
+    case_reporter = reporter.case_started(seq_case)
+    case_reporter.got_result(
+        SeqResult(
+            seq=1,
+            implementation="foo",
+            expected=[None],
+            result=CaseResult(results=[TestResult.VALID]),
+        ),
+    )
+    reporter.finished(count=1, did_fail_fast=False)
+
+    lines = file.buffer.getvalue().decode().splitlines()
+    report = Report.from_serialized(lines)
+    [(case, _)] = report.cases_with_results()
+    assert case.tests[0].instance == "\ud800"
+
+
+def test_duplicate_case():
+    seq_case = SeqCase(
+        seq=1,
+        case=TestCase(
+            description="foo",
+            schema={},
+            tests=[Test(description="1", instance=1)],
+        ),
+    )
+    data = [
+        FOO_RUN.serializable(),
+        seq_case.serializable(),
+        seq_case.serializable(),
+        NO_FAIL_FAST,
+    ]
+    with pytest.raises(DuplicateCase):
+        Report.from_input(data)
+
+
+def test_missing_footer():
+    with pytest.raises(MissingFooter):
+        Report.from_input([FOO_RUN.serializable()])
+
+
+@pytest.mark.parametrize(
+    "file",
+    [StringIO(), TextIOWrapper(BytesIO(), encoding="utf-8")],
+    ids=["text", "binary"],
+)
+def test_writer_writes_json_lines(file):
+    write = writer(file)
+    write(seq=1, big=2**70)
+    write(did_fail_fast=False)
+    Reporter(write=write).flush()
+
+    file.seek(0)
+    lines = [json.loads(line) for line in file.read().splitlines()]
+    assert lines == [{"seq": 1, "big": 2**70}, {"did_fail_fast": False}]
+
+
+def test_writer_respects_encoding():
+    file = TextIOWrapper(BytesIO(), encoding="cp1252")
+    write = writer(file)
+    write(description="café ✓")
+    Reporter(write=write).flush()
+    file.flush()
+
+    line = file.buffer.getvalue().decode("cp1252")
+    assert json.loads(line) == {"description": "café ✓"}
+
+
+def test_writer_buffers_until_flushed():
+    file = TextIOWrapper(BytesIO(), encoding="utf-8")
+    write = writer(file)
+    write(seq=1)
+    assert file.buffer.getvalue() == b""
+
+    write.flush()
+    assert json.loads(file.buffer.getvalue()) == {"seq": 1}
+
+
+def test_writer_keeps_earlier_text_first():
+    file = TextIOWrapper(BytesIO(), encoding="utf-8")
+    file.write("earlier\n")
+    write = writer(file)
+    write(seq=1)
+    write.flush()
+
+    earlier, line = file.buffer.getvalue().splitlines()
+    assert (earlier, json.loads(line)) == (b"earlier", {"seq": 1})
+
+
+def test_background_writer():
+    file = TextIOWrapper(BytesIO(), encoding="utf-8")
+    write = writer(file, background=True)
+    for seq in range(100):
+        write(seq=seq)
+    Reporter(write=write).flush()
+
+    lines = file.buffer.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"seq": seq} for seq in range(100)
+    ]
+
+
+def test_background_writer_write_error():
+    class BrokenPipe(BytesIO):
+        def write(self, data):
+            raise BrokenPipeError()
+
+    file = TextIOWrapper(BrokenPipe(), encoding="utf-8")
+    write = writer(file, background=True)
+    write(seq=1)
+
+    with pytest.raises(BrokenPipeError):
+        write.flush()
+    with pytest.raises(BrokenPipeError):
+        write(seq=2)
+
+
+def test_background_writer_closed():
+    file = TextIOWrapper(BytesIO(), encoding="utf-8")
+    write = writer(file, background=True)
+    write(seq=1)
+    write.close()
+
+    assert json.loads(file.buffer.getvalue()) == {"seq": 1}
+    with pytest.raises(ValueError, match="closed"):
+        write(seq=2)
+    with pytest.raises(ValueError, match="closed"):
+        write.flush()
+    write.close()  # closing again is harmless, as with files